@@ -8,19 +8,72 @@ The data can be saved as text in a text or CSV file as well as saving a graph of
 
 import os
 import sys
+import csv
+import hashlib
 import numpy as np
 from PyQt6.QtGui import QIntValidator, QDoubleValidator
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QLocale, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QVBoxLayout, QWidget, QLabel, QMainWindow, QPushButton, QFileDialog, QComboBox, QLineEdit, QRadioButton, QSizePolicy, QHBoxLayout, QFrame, QCheckBox, QButtonGroup
-from sklearn.cluster import KMeans, MeanShift, DBSCAN, HDBSCAN, AgglomerativeClustering, AffinityPropagation, SpectralClustering, Birch, OPTICS
-from sklearn.mixture import GaussianMixture
-from sklearn.decomposition import PCA
-from sklearn.metrics import rand_score
-import re
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 
+# Directory of the application that the dialogs for loading and saving data start in
+application_directory = os.path.dirname(os.path.realpath(__file__))
+
+# scikit-learn is imported when data clustering is first performed rather than when the application starts
+sklearn_patched = False
+
+def patch_sklearn():
+    """Uses the accelerated implementations of the clustering algorithms from the Intel extension for scikit-learn
+    if it is installed. This needs to be done before the clustering algorithms are first imported."""
+    global sklearn_patched
+
+    if not sklearn_patched:
+        try:
+            import sklearnex
+            sklearnex.patch_sklearn()
+
+        except ImportError:
+            pass
+
+        sklearn_patched = True
+
+def save_clustered_data(filename_save, attribute_data, class_data, clustering_data_labels, data_clustering_algorithm, num_clusters, clustering_metric):
+    """Saves the clustered data from a display window to a text or CSV file followed by the clustering algorithm,
+    the number of clusters if the algorithm takes a number of clusters and the rand index if the data has
+    class assignments."""
+
+    # Formats the clustered data as text with the trailing zeros of the values removed
+    attribute_data_save = attribute_data_text(attribute_data)
+    data_clustering_algorithm_save = ''.join(["Data clustering algorithm: ", data_clustering_algorithm, '\n'])
+    num_clusters_save = ""
+    clustering_metric_save = ""
+
+    if num_clusters:
+        num_clusters_save = ''.join(["Number of clusters: ", str(num_clusters), '\n'])
+
+    # The class of each data point is saved with the data point if the data has class assignments
+    if clustering_metric:
+        clustering_metric_save = ''.join([clustering_metric, '\n'])
+        file_save_data = np.column_stack([attribute_data_save, class_data.astype(str), clustering_data_labels.astype(str)])
+
+    else:
+        file_save_data = np.column_stack([attribute_data_save, clustering_data_labels.astype(str)])
+
+    # The rows of the clustered data are streamed by a CSV writer through a large file buffer rather than
+    # building the text of the whole file in memory
+    with open(filename_save, "w", encoding='utf-8', newline='', buffering=1 << 20) as file_save:
+        csv.writer(file_save, lineterminator='\n').writerows(file_save_data)
+        file_save.write(''.join([data_clustering_algorithm_save, num_clusters_save, clustering_metric_save]))
+
+def attribute_data_text(attribute_data):
+    """Returns the values of the clustered data as text. The values are formatted to 9 decimal places with
+    the trailing zeros and any trailing decimal point removed."""
+    attribute_data_values_text = np.char.mod('%.9f', attribute_data)
+
+    return np.char.rstrip(np.char.rstrip(attribute_data_values_text, '0'), '.')
+
 class DataClusteringVisualizerInterface(QMainWindow):
     """Graphical user interface for performing and visualizing data clustering on selected data."""
     def __init__(self):
@@ -58,6 +111,10 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.file_data_error_label = QLabel()
         self.file_data_error_label.setAccessibleName("File Data Error")
 
+        # Error message if the clustered data from a display window could not be saved
+        self.save_data_error_label = QLabel()
+        self.save_data_error_label.setAccessibleName("Save Data Error")
+
         # Displays the number of classes in the data if the data has class assignments
         self.data_classes_label = QLabel()
         self.data_classes_label.setAccessibleName("Data Classes Count")
@@ -78,7 +135,6 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.data_non_numbers_layout.setContentsMargins(0, 0, 0, 0)
         self.data_non_numbers_layout.setSpacing(0)
         self.data_non_numbers_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.feature_values_non_numbers_invalid_input = ["-", "+", ".", "-.", "+."]
 
         # Clustering algorithms that can be selected for clustering the data
         self.clustering_algorithm_select_label = QLabel("Clustering algorithm:")
@@ -86,7 +142,7 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.clustering_algorithm_combo_box.addItems(["", "K-Means", "Mean Shift", "DBSCAN", "HDBSCAN", "Gaussian Mixture Models", "Agglomerative", "Affinity Propagation", "Spectral", "BIRCH", "OPTICS"])
         self.clustering_algorithm_combo_box.setAccessibleName("Clustering Algorithm Options")
         self.clustering_algorithm_combo_box.currentIndexChanged.connect(self.clustering_algorithm_changed)
-        self.clustering_algorithms_no_num_clusters_input = ["Mean Shift", "DBSCAN", "HDBSCAN", "Affinity Propagation", "Spectral", "BIRCH", "OPTICS"]
+        self.clustering_algorithms_no_num_clusters_input = frozenset(["Mean Shift", "DBSCAN", "HDBSCAN", "Affinity Propagation", "Spectral", "BIRCH", "OPTICS"])
 
         # Option for entering in the number of clusters to cluster the data into for certain algorithms
         self.num_clusters_label = QLabel("Number of clusters:")
@@ -118,6 +174,11 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.display_dimensions_layout.setContentsMargins(0, 0, 0, 0)
         self.display_dimensions_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
+        # Option to graph a random sample of the data points when the data is too large to be graphed quickly
+        self.display_sample_check_box = QCheckBox("Sample large data for display")
+        self.display_sample_check_box.setAccessibleName("Display Sample Option")
+        self.display_sample_check_box.setChecked(True)
+
         # Buttons for displaying the graph of the clustered data in one of two windows to allow
         # for two graphs to be displayed at the same time and for comparison of data clustering
         self.display_data_clustering_label = QLabel("Display data clustering")
@@ -142,6 +203,7 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.side_panel_layout.addWidget(self.clustering_algorithm_combo_box)
         self.side_panel_layout.addWidget(self.display_dimensions_label)
         self.side_panel_layout.addWidget(self.display_dimensions_widget)
+        self.side_panel_layout.addWidget(self.display_sample_check_box)
         self.side_panel_layout.addWidget(self.display_data_clustering_label)
         self.side_panel_layout.addWidget(self.display_data_clustering_window_widget)
         self.side_panel_layout.setContentsMargins(0, 0, 0, 0)
@@ -151,8 +213,8 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.display_data_clustering_window1_button.setEnabled(False)
         self.display_data_clustering_window2_button.setEnabled(False)
 
-        self.removable_widgets_load_data = [self.file_data_error_label.accessibleName(), self.data_classes_label.accessibleName(), self.data_non_numbers_label.accessibleName(), self.data_non_numbers_option_combo_box.accessibleName(), self.data_non_numbers_widget.accessibleName(), self.num_clusters_label.accessibleName(), self.num_clusters_input.accessibleName()]
-        self.removable_widgets_process_data = [self.data_classes_label.accessibleName(), self.data_non_numbers_label.accessibleName(), self.data_non_numbers_option_combo_box.accessibleName(), self.data_non_numbers_widget.accessibleName()]
+        self.removable_widgets_load_data = [self.file_data_error_label, self.save_data_error_label, self.data_classes_label, self.data_non_numbers_label, self.data_non_numbers_option_combo_box, self.data_non_numbers_widget, self.num_clusters_label, self.num_clusters_input]
+        self.removable_widgets_process_data = [self.data_classes_label, self.data_non_numbers_label, self.data_non_numbers_option_combo_box, self.data_non_numbers_widget]
 
         # Initializing flag variables for conditions to be met for data clustering to the false state
         self.display_dimension = ""
@@ -181,6 +243,21 @@ class DataClusteringVisualizerInterface(QMainWindow):
         self.display_window1 = False
         self.display_window2 = False
 
+        # Cluster assignments and rand indices of previous data clusterings for reuse when the same clustering
+        # is displayed again
+        self.clustering_data_labels_cache = {}
+        self.clustering_data_rand_score_cache = {}
+
+        # Data for clustering and projections onto principal components of the data displayed in the open
+        # display windows for reuse when the same data is displayed again
+        self.principal_components_data_cache = {}
+        self.attribute_data_key_window1 = None
+        self.attribute_data_key_window2 = None
+
+        # Signals from the background threads that save clustered data
+        self.save_clustered_data_signals = SaveClusteredDataSignals()
+        self.save_clustered_data_signals.save_failed.connect(self.save_clustered_data_failed)
+
         self.setCentralWidget(self.window_widget)
 
         self.window_dimensions = [self.width(), self.height()]
@@ -190,12 +267,13 @@ class DataClusteringVisualizerInterface(QMainWindow):
         resets the graphical user interface and flag variables, checks for errors with the data,
         and calls the function for processing the data if the data does not have any errors."""
         dialog = QFileDialog(self)
-        dialog.setDirectory(os.path.dirname(os.path.realpath(__file__)))
+        dialog.setDirectory(application_directory)
         dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
         dialog.setNameFilter("Plain Text (*.txt);; Comma Separated Values (*.csv)")
         dialog.setViewMode(QFileDialog.ViewMode.List)
 
         self.file_data = []
+        self.file_data_strings = []
         self.file_data_non_numbers = []
 
         # Selection of data file
@@ -204,15 +282,7 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
             if len(filenames) >= 1:
                 self.filename = filenames[0]
-                i = 0
-
-                while i < self.side_panel_layout.count():
-                    if self.side_panel_layout.itemAt(i):
-                        if self.side_panel_layout.itemAt(i).widget().accessibleName() in self.removable_widgets_load_data:
-                            self.remove_widget(self.side_panel_layout, self.side_panel_layout.itemAt(i).widget())
-                            i = i - 1
-
-                    i = i + 1
+                self.remove_widgets(self.side_panel_layout, self.removable_widgets_load_data)
 
                 # Reset of graphical user interface components
                 self.data_non_numbers_option_combo_box.setCurrentIndex(0)
@@ -225,7 +295,10 @@ class DataClusteringVisualizerInterface(QMainWindow):
                     self.display_dimensions_button_group.checkedButton().setChecked(False)
                     self.display_dimensions_button_group.setExclusive(True)
 
-                # Reset of flag variables
+                # Reset of flag variables and previous data clusterings
+                self.clustering_data_labels_cache.clear()
+                self.clustering_data_rand_score_cache.clear()
+                self.principal_components_data_cache.clear()
                 self.data_imported = False
                 self.file_data_error = False
                 self.data_non_numbers = False
@@ -238,40 +311,45 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
                 # Loading of data file and checking for any errors
                 with open(self.filename, "r") as data_file:
-                    try:
-                        self.file_data = np.genfromtxt(data_file, delimiter=',')
+                    file_lines = data_file.readlines()
+
+                try:
+                    self.file_data = np.genfromtxt(file_lines, delimiter=',', ndmin=2)
+
+                except ValueError as error:
+                    if "columns instead of" in error.args[0]:
+                        self.file_data_error_label.setText("The file must contain data points with\nthe same number of entries denoting\nthe features and class.")
+                        self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
+                        self.file_data_error = True
+
+                else:
+                    if not self.file_data.any():
+                        self.file_data_error_label.setText("The file does not contain any data.")
+                        self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
+                        self.file_data_error = True
 
-                    except ValueError as error:
-                        if "columns instead of" in error.args[0]:
-                            self.file_data_error_label.setText("The file must contain data points with\nthe same number of entries denoting\nthe features and class.")
-                            self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
-                            self.file_data_error = True
+                    elif self.file_data.shape[0] == 1:
+                        self.file_data_error_label.setText("The file must contain at least two\ndata points.")
+                        self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
+                        self.file_data_error = True
+
+                    elif self.file_data.shape[1] == 1:
+                        self.file_data_error_label.setText("The file must contain at least two\ndata points and two features.")
+                        self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
+                        self.file_data_error = True
 
                     else:
-                        data_file.seek(0)
-
-                        if not self.file_data.any():
-                            self.file_data_error_label.setText("The file does not contain any data.")
-                            self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
-                            self.file_data_error = True
-
-                        elif len(data_file.readlines()) == 1 or len(self.file_data.shape) == 0:
-                            self.file_data_error_label.setText("The file must contain at least two\ndata points.")
-                            self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
-                            self.file_data_error = True
-
-                        elif len(self.file_data.shape) == 1:
-                            self.file_data_error_label.setText("The file must contain at least two\ndata points and two features.")
-                            self.insert_widget(self.side_panel_layout, self.data_with_classes_check_box, self.file_data_error_label)
-                            self.file_data_error = True
-
-                        else:
-                            self.data_imported = True
-                            self.file_data_error = False
-                            self.data_non_numbers = False
-                            self.feature_values_non_numbers_entered = False
-                            self.feature_values_non_numbers_entered_not_applicable = False
-                            self.process_data()
+                        # Keeps the file entries as text if the data contains non-numeric values so that the file
+                        # does not need to be read again when the data is processed
+                        if np.isnan(self.file_data).any():
+                            self.file_data_strings = np.genfromtxt(file_lines, dtype=str, delimiter=',', encoding='utf8', ndmin=2)
+
+                        self.data_imported = True
+                        self.file_data_error = False
+                        self.data_non_numbers = False
+                        self.feature_values_non_numbers_entered = False
+                        self.feature_values_non_numbers_entered_not_applicable = False
+                        self.process_data()
 
     def process_data(self):
         """Checks if the data has enough features for data clustering to be performed.
@@ -279,19 +357,14 @@ class DataClusteringVisualizerInterface(QMainWindow):
         and includes graphical user interface components for handling non-numeric values
         if the data contains such values."""
         if self.data_imported:
-            if len(self.data_non_numbers_widget.children()) > 1:
-                for i in self.data_non_numbers_widget.children():
-                    self.remove_widget_child(self.data_non_numbers_layout)
+            self.clustering_data_labels_cache.clear()
+            self.clustering_data_rand_score_cache.clear()
+            self.principal_components_data_cache.clear()
 
-            i = 0
-
-            while i < self.side_panel_layout.count():
-                if self.side_panel_layout.itemAt(i):
-                    if self.side_panel_layout.itemAt(i).widget().accessibleName() in self.removable_widgets_process_data:
-                        self.remove_widget(self.side_panel_layout, self.side_panel_layout.itemAt(i).widget())
-                        i = i - 1
+            if len(self.data_non_numbers_widget.children()) > 1:
+                self.remove_widget_child(self.data_non_numbers_layout)
 
-                i = i + 1
+            self.remove_widgets(self.side_panel_layout, self.removable_widgets_process_data)
 
             self.data_non_numbers = False
 
@@ -306,20 +379,14 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
                 # Checks for non-numeric values in the data
                 else:
-                    for row in self.file_data:
-                        if np.isnan(row[:-1]).any():
-                            self.data_non_numbers = True
-                            break
+                    self.data_non_numbers = bool(np.isnan(self.file_data[:, :-1]).any())
 
             else:
                 self.remove_widget(self.side_panel_layout, self.file_data_error_label)
                 self.file_data_error = False
 
                 # Checks for non-numeric values in the data
-                for row in self.file_data:
-                    if np.isnan(row).any():
-                        self.data_non_numbers = True
-                        break
+                self.data_non_numbers = bool(np.isnan(self.file_data).any())
 
             # Processes the data if the data has no errors
             if not self.file_data_error:
@@ -330,22 +397,18 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
                 # Processes the data if it contains non-numeric values
                 if self.data_non_numbers:
-                    with open(self.filename, "r") as data_file:
-                        self.file_data_non_numbers = np.genfromtxt(data_file, dtype=str, delimiter=',', filling_values=-99999, encoding='utf8')
-                        self.file_data_non_numbers = np.array([list(data_point) for data_point in self.file_data_non_numbers])
+                    self.file_data_non_numbers = self.file_data_strings
 
                     if self.data_with_classes:
                         self.attribute_data_all = self.file_data_non_numbers[:, :-1]
-                        self.class_data = self.file_data_non_numbers[:, -1]
-                        self.num_classes = np.unique(self.class_data).size
+                        self.attribute_data_all_float = self.file_data[:, :-1]
 
                     else:
                         self.attribute_data_all = self.file_data_non_numbers
+                        self.attribute_data_all_float = self.file_data
 
                 elif self.data_with_classes:
                     self.attribute_data_all = self.file_data[:, :-1]
-                    self.class_data = self.file_data[:, -1]
-                    self.num_classes = np.unique(self.class_data).size
                     self.attribute_data = self.attribute_data_all
                     self.feature_values_non_numbers_entered_not_applicable = True
 
@@ -354,63 +417,49 @@ class DataClusteringVisualizerInterface(QMainWindow):
                     self.attribute_data = self.attribute_data_all
                     self.feature_values_non_numbers_entered_not_applicable = True
 
+                # The class assignments are kept as text if the data has non-numeric values or any class is not a number,
+                # as the classes that are not numbers are not read from the file as numbers
+                if self.data_with_classes:
+                    if self.data_non_numbers or np.isnan(self.file_data[:, -1]).any():
+                        self.class_data = self.file_data_strings[:, -1]
+
+                    else:
+                        self.class_data = self.file_data[:, -1]
+
+                    class_values, self.class_data_codes = np.unique(self.class_data, return_inverse=True)
+                    self.class_data_codes = self.class_data_codes.astype(np.int32)
+                    self.num_classes = class_values.size
+
                 self.non_number_values_file = [[] for col in range(self.attribute_data_all.shape[1])]
                 self.non_number_values = []
 
                 # Keeps track of non-numeric values so that they can be converted into numeric values for clustering of numeric data
                 if self.data_non_numbers:
-                    for col in range(self.attribute_data_all.shape[1]):
-                        for row, value in enumerate(self.attribute_data_all[:, col]):
-                            repeated_value = 0
-
-                            if value and not value == "-99999" and not value == "-99999.0":
-                                if value[0] == "-":
-                                    if not str.isnumeric(value.replace('-', '', 1).replace('.', '', 1)):
-                                        for feature_value in self.non_number_values_file[col]:
-                                            if value == feature_value[2]:
-                                                feature_value[1].append(row)
-                                                repeated_value = 1
-                                                break
-
-                                        if not repeated_value:
-                                            self.non_number_values_file[col].append([col, [row], value, None])
-
-                                elif value[0] == "+":
-                                    if not str.isnumeric(value.replace('+', '', 1).replace('.', '', 1)):
-                                        for feature_value in self.non_number_values_file[col]:
-                                            if value == feature_value[2]:
-                                                feature_value[1].append(row)
-                                                repeated_value = 1
-                                                break
-
-                                        if not repeated_value:
-                                            self.non_number_values_file[col].append([col, [row], value, None])
-
-                                elif not str.isnumeric(value.replace('.', '', 1)):
-                                    for feature_value in self.non_number_values_file[col]:
-                                        if value == feature_value[2]:
-                                            feature_value[1].append(row)
-                                            repeated_value = 1
-                                            break
-
-                                    if not repeated_value:
-                                        self.non_number_values_file[col].append([col, [row], value, None])
-
-                            else:
-                                self.attribute_data_all[row, col] = ""
-
-                                for feature_value in self.non_number_values_file[col]:
-                                    if self.attribute_data_all[row, col] == feature_value[2]:
-                                        feature_value[1].append(row)
-                                        repeated_value = 1
-                                        break
-
-                                if not repeated_value:
-                                    self.non_number_values_file[col].append([col, [row], self.attribute_data_all[row, col], None])
-
-                    self.non_number_values_file = [self.non_number_values_file[feature_index] for feature_index in range(len(self.non_number_values_file)) if self.non_number_values_file[feature_index]]
+                    # The cells that could not be read as numbers when the file was loaded are the non-numeric values
+                    non_numbers_mask = np.isnan(self.file_data[:, :self.attribute_data_all.shape[1]])
+
+                    # The features are independent of each other so their non-numeric values are found in parallel
+                    # if more than one feature has non-numeric values
+                    non_numbers_features = np.flatnonzero(non_numbers_mask.any(axis=0))
+
+                    if non_numbers_features.size > 1:
+                        from joblib import Parallel, delayed
+
+                        self.non_number_values_file = Parallel(n_jobs=-1, prefer='threads')(delayed(self.feature_non_number_values)(col, np.flatnonzero(non_numbers_mask[:, col])) for col in non_numbers_features)
+
+                    else:
+                        self.non_number_values_file = [self.feature_non_number_values(col, np.flatnonzero(non_numbers_mask[:, col])) for col in non_numbers_features]
                     self.non_number_values = self.non_number_values_file
 
+                    # Number of non-numeric values that have not been assigned to a number, kept up to date as numbers are assigned
+                    self.num_non_number_values_unassigned = sum(len(feature) for feature in self.non_number_values_file)
+
+                    # Positions of all non-numeric values in the data for the options that handle every non-numeric value at once
+                    non_number_values = [value for feature in self.non_number_values_file for value in feature]
+                    self.non_number_rows = np.concatenate([value[1] for value in non_number_values])
+                    non_number_cols = np.repeat([value[0] for value in non_number_values], [len(value[1]) for value in non_number_values])
+                    self.non_number_flat_indices = np.ravel_multi_index((self.non_number_rows, non_number_cols), self.attribute_data_all_float.shape)
+
                 if self.data_with_classes:
                     if int(self.num_classes) > 1:
                         self.data_classes_label.setText("The selected data file has " + str(self.num_classes) + " classes.")
@@ -464,7 +513,8 @@ class DataClusteringVisualizerInterface(QMainWindow):
                     self.features_non_numbers_combo_box.currentIndexChanged.connect(self.feature_non_numbers_selection_changed)
 
                     self.data_non_numbers_layout.addWidget(self.features_non_numbers_combo_box)
-                    self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_combo_box_list[0])
+                    self.feature_values_non_numbers_combo_box = self.feature_values_non_numbers_combo_box_list[0]
+                    self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_combo_box)
                     self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_input)
 
                     if self.data_with_classes:
@@ -491,6 +541,17 @@ class DataClusteringVisualizerInterface(QMainWindow):
             self.num_clusters_changed()
             self.display_data_clustering_enable()
 
+    def feature_non_number_values(self, col, rows):
+        """Returns the non-numeric values of a feature along with the rows that each value is in.
+        The values are in the order that they first appear in the data."""
+        values = self.attribute_data_all[rows, col]
+        unique_values, unique_values_rows, values_indices = np.unique(values, return_index=True, return_inverse=True)
+
+        # Groups the rows by value in one pass with the rows of each value kept in order
+        values_rows = np.split(rows[np.argsort(values_indices, kind='stable')], np.cumsum(np.bincount(values_indices))[:-1])
+
+        return [[col, values_rows[value_index], unique_values[value_index], None] for value_index in np.argsort(unique_values_rows)]
+
     def data_with_classes_option_changed(self):
         """The condition of whether or not the data contains class assignments with each data point.
         If the data contains class assignments, then the classes are not included with the data that
@@ -519,14 +580,8 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         # Option for setting all non-numeric values to zero
         elif self.data_non_numbers_option_combo_box.currentIndex() == 1:
-            self.attribute_data = self.attribute_data_all
-
-            for feature in self.non_number_values:
-                for value in feature:
-                    for row in value[1]:
-                        self.attribute_data[row, value[0]] = 0
-
-            self.attribute_data = self.attribute_data.astype(float)
+            self.attribute_data = self.attribute_data_all_float.copy()
+            np.put(self.attribute_data, self.non_number_flat_indices, 0)
 
             self.remove_widget(self.side_panel_layout, self.data_non_numbers_widget)
 
@@ -537,22 +592,10 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         # Option for assigning non-numeric values to number input
         elif self.data_non_numbers_option_combo_box.currentIndex() == 2:
-            self.attribute_data = np.empty(self.attribute_data_all.shape, dtype=self.attribute_data_all.dtype)
-            non_number_indices = [(row, col[0][0]) for col in self.non_number_values_file for value in col for row in value[1]]
-
-            for index, value in np.ndenumerate(self.attribute_data_all):
-                if not index in non_number_indices:
-                    self.attribute_data[index] = self.attribute_data_all[index]
+            self.attribute_data = self.attribute_data_all_float.copy()
 
-            for feature in self.non_number_values:
-                for value in feature:
-                    if value[3]:
-                        for row in value[1]:
-                            self.attribute_data[row, value[0]] = value[3]
-
-                    else:
-                        for row in value[1]:
-                            self.attribute_data[row, value[0]] = None
+            non_number_values = [value for feature in self.non_number_values for value in feature]
+            np.put(self.attribute_data, self.non_number_flat_indices, np.repeat([np.nan if value[3] is None else value[3] for value in non_number_values], [len(value[1]) for value in non_number_values]))
 
             self.display_data_clustering_window1_button.setEnabled(False)
             self.display_data_clustering_window2_button.setEnabled(False)
@@ -561,25 +604,18 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
             feature_index = self.features_non_numbers_combo_box.currentIndex()
             feature_value_index = self.feature_values_non_numbers_combo_box_list[feature_index].currentIndex()
-            self.feature_values_non_numbers_input.setText(self.non_number_values[feature_index][feature_value_index][3])
+            self.feature_values_non_numbers_input.setText(self.feature_value_number_text(self.non_number_values[feature_index][feature_value_index][3]))
 
             self.data_non_numbers_layout.addWidget(self.features_non_numbers_combo_box)
-            self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_combo_box_list[feature_index])
+            self.feature_values_non_numbers_combo_box = self.feature_values_non_numbers_combo_box_list[feature_index]
+            self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_combo_box)
             self.data_non_numbers_layout.addWidget(self.feature_values_non_numbers_input)
             self.insert_widget(self.side_panel_layout, self.data_non_numbers_option_combo_box, self.data_non_numbers_widget)
 
             self.feature_values_non_numbers_entered_not_applicable = False
-            feature_values_non_numbers_assigned = True
 
             # Check to ensure that non-numeric values have not been assigned to numbers
-            for feature in self.non_number_values:
-                for value in feature:
-                    if not value[3]:
-                        feature_values_non_numbers_assigned = False
-                        break
-
-            if feature_values_non_numbers_assigned:
-                self.attribute_data = self.attribute_data.astype(float)
+            if self.num_non_number_values_unassigned == 0:
                 self.feature_values_non_numbers_entered = True
 
             else:
@@ -589,17 +625,9 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         # Option for removing all rows in the data that have non-numeric values
         elif self.data_non_numbers_option_combo_box.currentIndex() == 3:
-            self.attribute_data = self.attribute_data_all
-            remove_rows = []
-
-            for feature in self.non_number_values_file:
-                for value in feature:
-                    for row in value[1]:
-                        remove_rows.append(row)
-
-            remove_rows = np.unique(remove_rows)
-            self.attribute_data = np.delete(self.attribute_data, remove_rows, 0)
-            self.attribute_data = self.attribute_data.astype(float)
+            keep_rows = np.ones(self.attribute_data_all.shape[0], dtype=bool)
+            keep_rows[self.non_number_rows] = False
+            self.attribute_data = self.attribute_data_all_float[keep_rows]
 
             self.remove_widget(self.side_panel_layout, self.data_non_numbers_widget)
 
@@ -610,14 +638,9 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         # Option for removing all columns in the data that have non-numeric values
         elif self.data_non_numbers_option_combo_box.currentIndex() == 4:
-            self.attribute_data = self.attribute_data_all
-            remove_columns = []
-
-            for feature in self.non_number_values_file:
-                remove_columns.append(feature[0][0])
-
-            self.attribute_data = np.delete(self.attribute_data, remove_columns, 1)
-            self.attribute_data = self.attribute_data.astype(float)
+            keep_columns = np.ones(self.attribute_data_all.shape[1], dtype=bool)
+            keep_columns[[feature[0][0] for feature in self.non_number_values_file]] = False
+            self.attribute_data = self.attribute_data_all_float[:, keep_columns]
 
             self.remove_widget(self.side_panel_layout, self.data_non_numbers_widget)
 
@@ -634,25 +657,22 @@ class DataClusteringVisualizerInterface(QMainWindow):
         # Removes non-numeric values selection list from graphical user interface for the previously selected
         # data feature and adds the newly selected non-numeric values selection list for the option
         # for assigning non-numeric values to number input
-        for i in range(self.data_non_numbers_layout.count()):
-            if self.data_non_numbers_layout.itemAt(i).widget().accessibleName() == "Feature Values":
-                replaced_widget = self.data_non_numbers_layout.itemAt(i).widget()
-                self.data_non_numbers_layout.removeWidget(replaced_widget)
-                replaced_widget.setParent(None)
-                inserted_widget = self.feature_values_non_numbers_combo_box_list[feature_index]
-                inserted_widget.setCurrentIndex(0)
-                self.data_non_numbers_layout.insertWidget(i, inserted_widget)
-                break
+        i = self.data_non_numbers_layout.indexOf(self.feature_values_non_numbers_combo_box)
+        self.data_non_numbers_layout.removeWidget(self.feature_values_non_numbers_combo_box)
+        self.feature_values_non_numbers_combo_box.setParent(None)
+        self.feature_values_non_numbers_combo_box = self.feature_values_non_numbers_combo_box_list[feature_index]
+        self.feature_values_non_numbers_combo_box.setCurrentIndex(0)
+        self.data_non_numbers_layout.insertWidget(i, self.feature_values_non_numbers_combo_box)
 
         feature_value_index = self.feature_values_non_numbers_combo_box_list[feature_index].currentIndex()
-        self.feature_values_non_numbers_input.setText(self.non_number_values[feature_index][feature_value_index][3])
+        self.feature_values_non_numbers_input.setText(self.feature_value_number_text(self.non_number_values[feature_index][feature_value_index][3]))
 
     def feature_values_non_numbers_selection_changed(self):
         """Changes the value for a feature to the selected value for the user to assign a numeric value
         to as one of the options for handling non-numeric values."""
         feature_index = self.features_non_numbers_combo_box.currentIndex()
         feature_value_index = self.feature_values_non_numbers_combo_box_list[feature_index].currentIndex()
-        self.feature_values_non_numbers_input.setText(self.non_number_values[feature_index][feature_value_index][3])
+        self.feature_values_non_numbers_input.setText(self.feature_value_number_text(self.non_number_values[feature_index][feature_value_index][3]))
 
     def feature_values_non_numbers_changed(self):
         """Updates the numeric value assigned to a non-numeric value for a feature and checks if
@@ -664,47 +684,49 @@ class DataClusteringVisualizerInterface(QMainWindow):
         col = self.non_number_values[feature_index][feature_value_index][0]
         feature_values_non_numbers_combo_box_text = self.feature_values_non_numbers_combo_box_list[feature_index].currentText()
 
+        # The number input is read in the locale of its validator, which accepts group separators and
+        # the decimal separator of the locale that Python's float() does not
+        feature_value_number, feature_value_number_valid = self.feature_values_non_numbers_input.validator().locale().toDouble(self.feature_values_non_numbers_input.text())
+        feature_value_number_valid = feature_value_number_valid and self.feature_values_non_numbers_input.hasAcceptableInput()
+
         # Assigns number input to all instances of the corresponding non-numeric value if number input is already equal to
         # the numeric value for that non-numeric value to ensure non-numeric values and instances of
         # the non-numeric value in the data array are assigned to that number
-        if self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and self.feature_values_non_numbers_input.text() and not self.feature_values_non_numbers_input.text() in self.feature_values_non_numbers_invalid_input:
-            self.non_number_values[feature_index][feature_value_index][3] = self.feature_values_non_numbers_input.text()
+        if self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and feature_value_number_valid:
+            if self.non_number_values[feature_index][feature_value_index][3] is None:
+                self.num_non_number_values_unassigned -= 1
 
-            for row in rows:
-                self.attribute_data[row][col] = self.non_number_values[feature_index][feature_value_index][3]
+            self.non_number_values[feature_index][feature_value_index][3] = feature_value_number
 
-            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, feature_values_non_numbers_combo_box_text + " (" + self.feature_values_non_numbers_input.text() + ")")
+            self.attribute_data[rows, col] = feature_value_number
+
+            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, f"{feature_values_non_numbers_combo_box_text} ({self.feature_value_number_text(feature_value_number)})")
 
         # Assigns number input to all instances of the corresponding non-numeric value if the number input is different from
         # the numeric value assigned to the non-numeric value
-        elif not self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and self.feature_values_non_numbers_input.text() and not self.feature_values_non_numbers_input.text() in self.feature_values_non_numbers_invalid_input:
-            self.non_number_values[feature_index][feature_value_index][3] = self.feature_values_non_numbers_input.text()
+        elif not self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and feature_value_number_valid:
+            if self.non_number_values[feature_index][feature_value_index][3] is None:
+                self.num_non_number_values_unassigned -= 1
+
+            self.non_number_values[feature_index][feature_value_index][3] = feature_value_number
 
-            for row in rows:
-                self.attribute_data[row][col] = self.non_number_values[feature_index][feature_value_index][3]
+            self.attribute_data[rows, col] = feature_value_number
 
-            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, feature_values_non_numbers_combo_box_text.rsplit(' ', 1)[0] + " (" + self.feature_values_non_numbers_input.text() + ")")
+            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, f"{feature_values_non_numbers_combo_box_text.rsplit(' ', 1)[0]} ({self.feature_value_number_text(feature_value_number)})")
 
         # Assigns non-numeric value to an empty value if there is no number input or the input is not numeric
-        elif not self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and (not self.feature_values_non_numbers_input.text() or self.feature_values_non_numbers_input.text() in self.feature_values_non_numbers_invalid_input):
-            self.non_number_values[feature_index][feature_value_index][3] = ""
+        elif not self.non_number_values[feature_index][feature_value_index][2] == feature_values_non_numbers_combo_box_text and not feature_value_number_valid:
+            if self.non_number_values[feature_index][feature_value_index][3] is not None:
+                self.num_non_number_values_unassigned += 1
 
-            for row in rows:
-                self.attribute_data[row][col] = None
+            self.non_number_values[feature_index][feature_value_index][3] = None
 
-            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, feature_values_non_numbers_combo_box_text.rsplit(' ', 1)[0])
+            self.attribute_data[rows, col] = np.nan
 
-        feature_values_non_numbers_assigned = True
+            self.feature_values_non_numbers_combo_box_list[feature_index].setItemText(feature_value_index, feature_values_non_numbers_combo_box_text.rsplit(' ', 1)[0])
 
         # Checks if all non-numeric values have been assigned to a number as a condition for clustering numeric data
-        for feature in self.non_number_values:
-            for value in feature:
-                if not value[3]:
-                    feature_values_non_numbers_assigned = False
-                    break
-
-        if feature_values_non_numbers_assigned:
-            self.attribute_data = self.attribute_data.astype(float)
+        if self.num_non_number_values_unassigned == 0:
             self.feature_values_non_numbers_entered = True
 
         else:
@@ -712,6 +734,14 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         self.display_data_clustering_enable()
 
+    def feature_value_number_text(self, feature_value_number):
+        """Returns the number assigned to a non-numeric value as text in the locale of the number input,
+        or empty text if no number has been assigned to the non-numeric value."""
+        if feature_value_number is None:
+            return ""
+
+        return self.feature_values_non_numbers_input.validator().locale().toString(feature_value_number, 'g', QLocale.FloatingPointPrecisionOption.FloatingPointShortest)
+
     def clustering_algorithm_changed(self):
         """Changes the clustering algorithm that is to be used for clustering the data to
         the selected clustering algorithm and displays or removes a component
@@ -783,82 +813,100 @@ class DataClusteringVisualizerInterface(QMainWindow):
         is also displayed with respect to the class assignments for the data.
         Options for closing each display window and saving the clustering data and graphs are also shown."""
 
+        # The display window that the data clustering is displayed in is given by the button that was clicked
+        display_window_name = self.sender().accessibleName()
+
+        patch_sklearn()
+        from sklearn.metrics import rand_score
+
         # Assignment of data clustering parameters
         data_clustering_algorithm = self.clustering_algorithm_combo_box.currentText()
         num_clusters = 0 if self.num_clusters_input.text() == "" else int(self.num_clusters_input.text())
         dimension = 2 if self.display_dimension == "2D" else 3
-        pca = PCA(dimension)
-        pca_data = pca.fit_transform(self.attribute_data)
         title = data_clustering_algorithm
-        clustering_data_labels = []
         clustering_metric = ""
 
-        # Clustering of the data with the clustering algorithm that has been selected
-        if data_clustering_algorithm == "K-Means":
-            clustering_data = KMeans(num_clusters).fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        # The data is identified by its contents as the options for handling non-numeric values rebuild the data,
+        # hashed through a memoryview so that the data is not copied into bytes
+        attribute_data_key = (self.attribute_data.shape, hashlib.blake2b(memoryview(np.ascontiguousarray(self.attribute_data))).digest())
 
-        elif data_clustering_algorithm == "Mean Shift":
-            clustering_data = MeanShift().fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        # Data for clustering and projection of the data onto its principal components, reusing those from an earlier
+        # display of the same data with the projection kept for each dimensionality
+        if attribute_data_key not in self.principal_components_data_cache:
+            self.principal_components_data_cache[attribute_data_key] = (self.clustering_input_data(), {})
 
-        elif data_clustering_algorithm == "DBSCAN":
-            clustering_data = DBSCAN().fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        clustering_input_data, pca_data_dimensions = self.principal_components_data_cache[attribute_data_key]
 
-        elif data_clustering_algorithm == "HDBSCAN":
-            clustering_data = HDBSCAN(min_samples=2).fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        if dimension not in pca_data_dimensions:
+            pca_data_dimensions[dimension] = self.principal_components_data(dimension, clustering_input_data)
 
-        elif data_clustering_algorithm == "Gaussian Mixture Models":
-            clustering_data_labels = GaussianMixture(num_clusters).fit_predict(self.attribute_data)
+        pca_data = pca_data_dimensions[dimension]
 
-        elif data_clustering_algorithm == "Agglomerative":
-            clustering_data = AgglomerativeClustering(num_clusters).fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        # Clustering of the data with the clustering algorithm that has been selected, reusing the cluster assignments
+        # from an earlier clustering of the same data with the same clustering parameters
+        clustering_data_key = (data_clustering_algorithm, None if data_clustering_algorithm in self.clustering_algorithms_no_num_clusters_input else num_clusters) + attribute_data_key
 
-        elif data_clustering_algorithm == "Affinity Propagation":
-            clustering_data = AffinityPropagation().fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
-
-        elif data_clustering_algorithm == "Spectral":
-            if self.attribute_data.shape[0] < 8:
-                clustering_data = SpectralClustering(self.attribute_data.shape[0]).fit(self.attribute_data)
-
-            else:
-                clustering_data = SpectralClustering().fit(self.attribute_data)
+        if clustering_data_key in self.clustering_data_labels_cache:
+            clustering_data_labels = self.clustering_data_labels_cache[clustering_data_key]
 
-            clustering_data_labels = clustering_data.labels_
-
-        elif data_clustering_algorithm == "BIRCH":
-            clustering_data = Birch().fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
-
-        elif data_clustering_algorithm == "OPTICS":
-            clustering_data = OPTICS(min_samples=2).fit(self.attribute_data)
-            clustering_data_labels = clustering_data.labels_
+        else:
+            clustering_data_labels = self.cluster_data(data_clustering_algorithm, num_clusters, clustering_input_data)
+            self.clustering_data_labels_cache[clustering_data_key] = clustering_data_labels
 
         # Constructs the layout containing the graph of the data clustering
         display_window_layout = QVBoxLayout()
         display_window_widget = QWidget()
         display_window_widget.setLayout(display_window_layout)
-        display_window_widget.setMinimumWidth(int((self.window_dimensions[0] - self.side_panel_widget.width() - self.separator_line.width())/3))
-        separator_line_width = self.separator_line.width()
-        plot_width = int(self.width() - self.side_panel_widget.width() - self.separator_line.width()) if ((self.display_window1 and not self.display_window2) or (self.display_window2 and not self.display_window1) or not any([self.display_window1, self.display_window2])) else int((self.width() - self.side_panel_widget.width() - self.separator_line.width() - separator_line_width)/2)
+        display_window_minimum_width, plot_width, resized_width = self.display_window_geometry()
+        display_window_widget.setMinimumWidth(display_window_minimum_width)
         plot_width_conv = plot_width / self.physicalDpiX()
         plot_height = int((17/20)*self.height())
         plot_height_conv = plot_height / self.physicalDpiY()
-        data_clustering_figure = PlotWidget(plot_width_conv, plot_height_conv, title, dimension)
-        data_clustering_figure.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        # Reuses the graph of the selected display window if the window is open and is graphed in the same
+        # dimensionality instead of constructing a new figure
+        if display_window_name == "Show Display 1":
+            data_clustering_figure = self.plot_widget_window1 if self.display_window1 else None
+
+        else:
+            data_clustering_figure = self.plot_widget_window2 if self.display_window2 else None
+
+        if data_clustering_figure is not None and data_clustering_figure.dimension == dimension:
+            data_clustering_figure.parentWidget().layout().removeWidget(data_clustering_figure)
+            data_clustering_figure.clear_graph(title)
+
+        else:
+            data_clustering_figure = PlotWidget(plot_width_conv, plot_height_conv, title, dimension)
+            data_clustering_figure.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        # Graphs a random sample of 50000 data points if the data has more data points than that and the option
+        # is selected, the clustering itself is still performed on all of the data
+        graph_data = pca_data
+        graph_data_labels = clustering_data_labels
+
+        if self.display_sample_check_box.isChecked() and clustering_data_labels.size > 50000:
+            graph_data_indices = np.sort(np.random.default_rng(0).choice(clustering_data_labels.size, 50000, replace=False))
+            graph_data = pca_data[graph_data_indices]
+            graph_data_labels = clustering_data_labels[graph_data_indices]
+
+        # Orders the data points by cluster so that the clusters are drawn one after another as contiguous
+        # runs of data points, keeping the order of the data points within each cluster
+        graph_data_order = np.argsort(graph_data_labels, kind='stable')
+        graph_data = graph_data[graph_data_order]
+        graph_data_labels = graph_data_labels[graph_data_order]
+
+        # Color of each data point in the graph given by the cluster that it is in, so that all of the clusters
+        # are graphed together
+        graph_data_colors = plt.cm.jet(graph_data_labels/np.max(clustering_data_labels+1))
 
         # Graphs the data clustering in 2D or 3D depending on the dimensionality that has been selected
         if dimension == 2:
-            for l in np.unique(clustering_data_labels):
-                data_clustering_figure.ax.scatter(pca_data[clustering_data_labels == l, 0], pca_data[clustering_data_labels == l, 1], color=plt.cm.jet(float(l)/np.max(clustering_data_labels+1)))
+            data_clustering_figure.ax.scatter(graph_data[:, 0], graph_data[:, 1], c=graph_data_colors)
 
         else:
-            for l in np.unique(clustering_data_labels):
-                data_clustering_figure.ax.scatter(pca_data[clustering_data_labels == l, 0], pca_data[clustering_data_labels == l, 1], pca_data[clustering_data_labels == l, 2], color=plt.cm.jet(float(l)/np.max(clustering_data_labels+1)))
+            data_clustering_figure.ax.scatter(graph_data[:, 0], graph_data[:, 1], graph_data[:, 2], c=graph_data_colors)
+
+        data_clustering_figure.draw_idle()
 
         display_window_button_layout = QHBoxLayout()
         display_window_button_widget = QWidget()
@@ -884,7 +932,14 @@ class DataClusteringVisualizerInterface(QMainWindow):
         # Adds the accuracy of the clustering algorithm's classification with respect to the class assignments in
         # the data if the data contains class assignments
         if self.data_with_classes:
-            clustering_data_rand_score = rand_score(self.class_data, clustering_data_labels)
+            if clustering_data_key in self.clustering_data_rand_score_cache:
+                clustering_data_rand_score = self.clustering_data_rand_score_cache[clustering_data_key]
+
+            else:
+                # The class assignments are compared as compact integer codes
+                clustering_data_rand_score = rand_score(self.class_data_codes, clustering_data_labels.astype(np.int32))
+                self.clustering_data_rand_score_cache[clustering_data_key] = clustering_data_rand_score
+
             display_window_clustering_metrics_label = QLabel("Rand index: " + "{:.2f}".format(clustering_data_rand_score))
             display_window_layout.addWidget(display_window_clustering_metrics_label)
             clustering_metric = display_window_clustering_metrics_label.text()
@@ -897,8 +952,9 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
         # Displays the data clustering graph in the first window if the option
         # to display the data clustering in the first window is selected
-        if self.sender().accessibleName() == "Show Display 1":
+        if display_window_name == "Show Display 1":
             self.attribute_data_window1 = self.attribute_data
+            self.attribute_data_key_window1 = attribute_data_key
             self.clustering_data_labels_window1 = clustering_data_labels
             self.data_clustering_algorithm_window1 = data_clustering_algorithm
 
@@ -924,23 +980,17 @@ class DataClusteringVisualizerInterface(QMainWindow):
 
             if not self.display_window1:
                 if self.display_window2:
-                    for i in range(self.window_layout.count()):
-                        if self.window_layout.itemAt(i).widget().accessibleName() == "Display 2":
-                            self.separator_line_display = QFrame()
-                            self.separator_line_display.setAccessibleName("Separator Line Display")
-                            self.separator_line_display.setFrameShape(QFrame.Shape.VLine)
-                            self.separator_line_display.setLineWidth(1)
-                            separator_line_width = self.separator_line.width()
-
-                            if self.width() <= (5/4)*self.window_dimensions[0]:
-                                self.resize(self.width() + separator_line_width + plot_width, self.height())
+                    i = self.window_layout.indexOf(self.display_window2_widget)
+                    self.separator_line_display = QFrame()
+                    self.separator_line_display.setAccessibleName("Separator Line Display")
+                    self.separator_line_display.setFrameShape(QFrame.Shape.VLine)
+                    self.separator_line_display.setLineWidth(1)
 
-                            elif self.width() < (17/8)*self.window_dimensions[0]:
-                                self.resize(int((17/8)*self.window_dimensions[0]), self.height())
+                    if resized_width:
+                        self.resize(resized_width, self.height())
 
-                            self.window_layout.insertWidget(i, self.separator_line_display)
-                            self.window_layout.insertWidget(i, display_window_widget)
-                            break
+                    self.window_layout.insertWidget(i, self.separator_line_display)
+                    self.window_layout.insertWidget(i, display_window_widget)
 
                 else:
                     self.window_layout.addWidget(display_window_widget)
@@ -948,16 +998,18 @@ class DataClusteringVisualizerInterface(QMainWindow):
                 self.display_window1 = True
 
             else:
-                for i in range(self.window_layout.count()):
-                    if self.window_layout.itemAt(i).widget().accessibleName() == "Display 1":
-                        self.window_layout.takeAt(i).widget().deleteLater()
-                        self.window_layout.insertWidget(i, display_window_widget)
-                        break
+                i = self.window_layout.indexOf(self.display_window1_widget)
+                self.window_layout.takeAt(i).widget().deleteLater()
+                self.window_layout.insertWidget(i, display_window_widget)
+
+            self.display_window1_widget = display_window_widget
+            self.plot_widget_window1 = data_clustering_figure
 
         # Displays the data clustering graph in the second window if the option
         # to display the data clustering in the second window is selected
-        elif self.sender().accessibleName() == "Show Display 2":
+        elif display_window_name == "Show Display 2":
             self.attribute_data_window2 = self.attribute_data
+            self.attribute_data_key_window2 = attribute_data_key
             self.clustering_data_labels_window2 = clustering_data_labels
             self.data_clustering_algorithm_window2 = data_clustering_algorithm
 
@@ -985,274 +1037,307 @@ class DataClusteringVisualizerInterface(QMainWindow):
                 self.separator_line_display.setAccessibleName("Separator Line Display")
                 self.separator_line_display.setFrameShape(QFrame.Shape.VLine)
                 self.separator_line_display.setLineWidth(1)
-                separator_line_width = self.separator_line.width()
-
-                if self.width() <= (5/4) * self.window_dimensions[0]:
-                    self.resize(self.width() + separator_line_width + plot_width, self.height())
 
-                elif self.width() < (17/8) * self.window_dimensions[0]:
-                    self.resize(int((17/8) * self.window_dimensions[0]), self.height())
+                if resized_width:
+                    self.resize(resized_width, self.height())
 
                 self.window_layout.addWidget(self.separator_line_display)
                 self.window_layout.addWidget(display_window_widget)
                 self.display_window2 = True
 
             else:
-                for i in range(self.window_layout.count()):
-                    if self.window_layout.itemAt(i).widget().accessibleName() == "Display 2":
-                        self.window_layout.takeAt(i).widget().deleteLater()
-                        self.window_layout.insertWidget(i, display_window_widget)
-                        break
+                i = self.window_layout.indexOf(self.display_window2_widget)
+                self.window_layout.takeAt(i).widget().deleteLater()
+                self.window_layout.insertWidget(i, display_window_widget)
 
-    def close_display_window(self):
-        """Closes the selected display window and decreases the size of the interface if
-        a display window is closed and two graphs were being displayed."""
-        if self.sender().accessibleName() == "Close Display 1":
-            for i in range(self.window_layout.count()):
-                if self.window_layout.itemAt(i).widget().accessibleName() == "Display 1":
-                    self.window_layout.takeAt(i).widget().deleteLater()
+            self.display_window2_widget = display_window_widget
+            self.plot_widget_window2 = data_clustering_figure
 
-                    if self.display_window2:
-                        for j in range(self.window_layout.count()):
-                            if self.window_layout.itemAt(j).widget().accessibleName() == "Separator Line Display":
-                                self.window_layout.takeAt(j).widget().deleteLater()
-                                break
+        self.remove_undisplayed_cache_data()
 
-                        separator_line_width = self.separator_line.width()
-                        self.resize(int(self.side_panel_widget.width() + self.separator_line.width() + (self.width() - self.side_panel_widget.width() - self.separator_line.width() - separator_line_width)/2), self.height())
+    def display_window_geometry(self):
+        """Returns the minimum width of a display window, the width of the graph in a display window and the width
+        that the interface is resized to when a second display window is opened, which is None if the interface
+        is already wide enough for two display windows."""
+        side_panel_width = self.side_panel_widget.width()
+        separator_line_width = self.separator_line.width()
+        window_width = self.width()
+        display_windows_width = window_width - side_panel_width - separator_line_width
+        display_window_minimum_width = int((self.window_dimensions[0] - side_panel_width - separator_line_width)/3)
 
-                    self.display_window1 = False
+        if self.display_window1 and self.display_window2:
+            plot_width = int((display_windows_width - separator_line_width)/2)
 
-                    if not self.display_window2:
-                        self.display_data_clustering_window2_button.setEnabled(False)
+        else:
+            plot_width = int(display_windows_width)
 
-                    break
+        if window_width <= (5/4)*self.window_dimensions[0]:
+            resized_width = window_width + separator_line_width + plot_width
 
-        elif self.sender().accessibleName() == "Close Display 2":
-            for i in range(self.window_layout.count()):
-                if self.window_layout.itemAt(i).widget().accessibleName() == "Display 2":
-                    self.window_layout.takeAt(i).widget().deleteLater()
+        elif window_width < (17/8)*self.window_dimensions[0]:
+            resized_width = int((17/8)*self.window_dimensions[0])
 
-                    if self.display_window1:
-                        for j in range(self.window_layout.count()):
-                            if self.window_layout.itemAt(j).widget().accessibleName() == "Separator Line Display":
-                                self.window_layout.takeAt(j).widget().deleteLater()
-                                break
+        else:
+            resized_width = None
 
-                        separator_line_width = self.separator_line.width()
-                        self.resize(int(self.side_panel_widget.width() + self.separator_line.width() + (self.width() - self.side_panel_widget.width() - self.separator_line.width() - separator_line_width)/2), self.height())
+        return display_window_minimum_width, plot_width, resized_width
 
-                    self.display_window2 = False
+    def cluster_data(self, data_clustering_algorithm, num_clusters, clustering_input_data):
+        """Clusters the data with the selected clustering algorithm and returns the cluster assignment of each data point."""
+        from sklearn.cluster import KMeans, MiniBatchKMeans, MeanShift, DBSCAN, HDBSCAN, AgglomerativeClustering, AffinityPropagation, SpectralClustering, Birch, OPTICS
+        from sklearn.mixture import GaussianMixture
 
-                    if not self.display_window1:
-                        self.display_data_clustering_window2_button.setEnabled(False)
+        clustering_data_labels = []
 
-                    break
+        if data_clustering_algorithm == "K-Means":
+            # Mini-batch K-means converges in a fraction of the time of K-means for data with many data points
+            if clustering_input_data.shape[0] > 10000:
+                clustering_data = MiniBatchKMeans(num_clusters, batch_size=1024, n_init=3, random_state=0).fit(clustering_input_data)
 
-    def save_data_clustering(self):
-        """Saves the clustering data as text with a text or CSV file or as an image of the graph."""
-        dialog = QFileDialog(self)
-        filename_data = dialog.getSaveFileName(self, "Save As", os.path.dirname(os.path.realpath(__file__)), "Plain Text (.txt);; Comma Separated Values (.csv);; JPEG (.jpg);; PNG (.png)")
+            else:
+                clustering_data = KMeans(num_clusters, n_init=1, algorithm='elkan', random_state=0).fit(clustering_input_data)
 
-        if filename_data[0]:
-            file_type = ""
-            filename_save = ""
+            clustering_data_labels = clustering_data.labels_
 
-            if filename_data[1]:
-                file_type = filename_data[1].rsplit('.', 1)[1].rsplit(')', 1)[0]
-                filename_save = filename_data[0] + "." + file_type
+        elif data_clustering_algorithm == "Mean Shift":
+            clustering_data = MeanShift().fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-            # Saves the clustered data as a text or CSV file if either of the two options is selected
-            if file_type == "txt" or file_type == "csv":
+        elif data_clustering_algorithm == "DBSCAN":
+            clustering_data = DBSCAN().fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                # Saves the clustered data from the first display window if the data from the first display window is selected to be saved
-                if self.sender().accessibleName() == "Save Display 1":
+        elif data_clustering_algorithm == "HDBSCAN":
+            clustering_data = HDBSCAN(min_samples=2).fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                    # Saves the clustered data to the file
-                    np.savetxt(filename_save, self.attribute_data_window1, fmt='%.9f', delimiter=',')
-                    file_save_data_list = []
-                    data_clustering_algorithm_save = ''.join(["Data clustering algorithm: ", self.data_clustering_algorithm_window1, '\n'])
-                    num_clusters_save = ""
-                    clustering_metric_save = ""
+        elif data_clustering_algorithm == "Gaussian Mixture Models":
+            clustering_data_labels = GaussianMixture(num_clusters).fit_predict(clustering_input_data)
 
-                    if self.num_clusters_window1:
-                        num_clusters_save = ''.join(["Number of clusters: ", str(self.num_clusters_window1), '\n'])
+        elif data_clustering_algorithm == "Agglomerative":
+            clustering_data = AgglomerativeClustering(num_clusters).fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                    if self.clustering_metric_window1:
-                        clustering_metric_save = ''.join([self.clustering_metric_window1, '\n'])
+        elif data_clustering_algorithm == "Affinity Propagation":
+            clustering_data = AffinityPropagation().fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                        # Removes leading and trailing zeros from the clustered data
-                        with open(filename_save, "r") as file_read:
-                            for i, row in enumerate(file_read):
-                                row = row.strip('\r').rstrip('\n')
-                                row = re.sub(r'\.0*(,)|\.0*$', r'\1', row)
-                                row = re.sub(r'(\.[0-9]*[1-9]+)0+(,)|(\.[0-9]*[1-9]+)0+$', r'\1\2', row)
-                                row = row + "," + str(self.class_data_window1[i])
-                                row = row + "," + str(self.clustering_data_labels_window1[i])
-                                file_save_data_list.append(row)
+        elif data_clustering_algorithm == "Spectral":
+            if self.attribute_data.shape[0] < 8:
+                clustering_data = SpectralClustering(self.attribute_data.shape[0]).fit(clustering_input_data)
 
-                        file_save_data = '\n'.join(file_save_data_list)
-                        file_save_data = ''.join([file_save_data, '\n'])
+            else:
+                clustering_data = SpectralClustering().fit(clustering_input_data)
 
-                        with open(filename_save, "w") as file_save:
-                            file_save.write(file_save_data)
-                            file_save.write(data_clustering_algorithm_save)
+            clustering_data_labels = clustering_data.labels_
 
-                            if num_clusters_save:
-                                file_save.write(num_clusters_save)
+        elif data_clustering_algorithm == "BIRCH":
+            clustering_data = Birch().fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                            file_save.write(clustering_metric_save)
+        elif data_clustering_algorithm == "OPTICS":
+            clustering_data = OPTICS(min_samples=2).fit(clustering_input_data)
+            clustering_data_labels = clustering_data.labels_
 
-                    else:
+        return clustering_data_labels
 
-                        # Removes leading and trailing zeros from the clustered data
-                        with open(filename_save, "r") as file_read:
-                            for i, row in enumerate(file_read):
-                                row = row.rstrip('\r').rstrip('\n')
-                                row = re.sub(r'\.0*(,)|\.0*$', r'\1', row)
-                                row = re.sub(r'(\.[0-9]*[1-9]+)0+(,)|(\.[0-9]*[1-9]+)0+$', r'\1\2', row)
-                                row = row + "," + str(self.clustering_data_labels_window1[i])
-                                file_save_data_list.append(row)
+    def clustering_input_data(self):
+        """Returns the data that the clustering algorithm is performed on. Data points with many features
+        are clustered on their principal components to reduce the cost of clustering the data. The data
+        for clustering is given in single precision to halve the memory used by the clustering algorithm."""
+        from sklearn.decomposition import PCA
 
-                        file_save_data = '\n'.join(file_save_data_list)
-                        file_save_data = ''.join([file_save_data, '\n'])
+        num_features = self.attribute_data.shape[1]
 
-                        with open(filename_save, "w") as file_save:
-                            file_save.write(file_save_data)
-                            file_save.write(data_clustering_algorithm_save)
+        if num_features > 16:
+            num_components = min(max(3, int(0.25*num_features)), self.attribute_data.shape[0])
+            clustering_input_data = PCA(num_components, svd_solver='randomized', random_state=0).fit_transform(self.attribute_data)
 
-                            if num_clusters_save:
-                                file_save.write(num_clusters_save)
+        else:
+            clustering_input_data = self.attribute_data
 
-                # Saves the clustered data from the second display window if the data from the second display window is selected to be saved
-                elif self.sender().accessibleName() == "Save Display 2":
+        # The features are centered before the data is given in single precision so that features with a large
+        # offset keep their variation, which does not change the distances between data points
+        return np.ascontiguousarray(clustering_input_data - clustering_input_data.mean(axis=0), dtype=np.float32)
 
-                    # Saves the clustered data to the file
-                    np.savetxt(filename_save, self.attribute_data_window2, fmt='%.9f', delimiter=',')
-                    file_save_data_list = []
-                    data_clustering_algorithm_save = ''.join(["Data clustering algorithm: ", self.data_clustering_algorithm_window2, '\n'])
-                    num_clusters_save = ""
-                    clustering_metric_save = ""
+    def principal_components_data(self, dimension, clustering_input_data):
+        """Returns the data projected onto its principal components in the dimensionality selected for graphing.
+        Data points with many features are already clustered on their principal components, so the graph
+        uses the first of those same components so that the data is only projected once."""
+        from sklearn.decomposition import PCA
 
-                    if self.num_clusters_window2:
-                        num_clusters_save = ''.join(["Number of clusters: ", str(self.num_clusters_window2), '\n'])
+        if self.attribute_data.shape[1] > 16:
+            return clustering_input_data[:, :dimension]
 
-                    if self.clustering_metric_window2:
-                        clustering_metric_save = ''.join([self.clustering_metric_window2, '\n'])
+        return PCA(dimension).fit_transform(self.attribute_data)
 
-                        # Removes leading and trailing zeros from the clustered data
-                        with open(filename_save, "r") as file_read:
-                            for i, row in enumerate(file_read):
-                                row = row.rstrip('\r').rstrip('\n')
-                                row = re.sub(r'\.0*(,)|\.0*$', r'\1', row)
-                                row = re.sub(r'(\.[0-9]*[1-9]+)0+(,)|(\.[0-9]*[1-9]+)0+$', r'\1\2', row)
-                                row = row + "," + str(self.class_data_window2[i])
-                                row = row + "," + str(self.clustering_data_labels_window2[i])
-                                file_save_data_list.append(row)
+    def remove_undisplayed_cache_data(self):
+        """Removes the cached data for clustering, projections, cluster assignments and rand indices of data
+        that is not displayed in an open display window so that the caches do not grow as the data is changed."""
+        displayed_attribute_data_keys = set()
 
-                        file_save_data = '\n'.join(file_save_data_list)
-                        file_save_data = ''.join([file_save_data, '\n'])
+        if self.display_window1:
+            displayed_attribute_data_keys.add(self.attribute_data_key_window1)
 
-                        with open(filename_save, "w") as file_save:
-                            file_save.write(file_save_data)
-                            file_save.write(data_clustering_algorithm_save)
+        if self.display_window2:
+            displayed_attribute_data_keys.add(self.attribute_data_key_window2)
 
-                            if num_clusters_save:
-                                file_save.write(num_clusters_save)
+        for attribute_data_key in list(self.principal_components_data_cache):
+            if attribute_data_key not in displayed_attribute_data_keys:
+                del self.principal_components_data_cache[attribute_data_key]
 
-                            file_save.write(clustering_metric_save)
+        # The cluster assignments and rand indices are keyed by the clustering parameters followed by the data
+        for clustering_data_key in list(self.clustering_data_labels_cache):
+            if clustering_data_key[2:] not in displayed_attribute_data_keys:
+                del self.clustering_data_labels_cache[clustering_data_key]
 
-                    else:
+        for clustering_data_key in list(self.clustering_data_rand_score_cache):
+            if clustering_data_key[2:] not in displayed_attribute_data_keys:
+                del self.clustering_data_rand_score_cache[clustering_data_key]
 
-                        # Removes leading and trailing zeros from the clustered data
-                        with open(filename_save, "r") as file_read:
-                            for i, row in enumerate(file_read):
-                                row = row.rstrip('\r').rstrip('\n')
-                                row = re.sub(r'\.0*(,)|\.0*$', r'\1', row)
-                                row = re.sub(r'(\.[0-9]*[1-9]+)0+(,)|(\.[0-9]*[1-9]+)0+$', r'\1\2', row)
-                                row = row + "," + str(self.clustering_data_labels_window2[i])
-                                file_save_data_list.append(row)
+    def close_display_window(self):
+        """Closes the selected display window and decreases the size of the interface if
+        a display window is closed and two graphs were being displayed."""
+        if self.sender().accessibleName() == "Close Display 1":
+            self.window_layout.takeAt(self.window_layout.indexOf(self.display_window1_widget)).widget().deleteLater()
 
-                        file_save_data = '\n'.join(file_save_data_list)
-                        file_save_data = ''.join([file_save_data, '\n'])
+            if self.display_window2:
+                self.window_layout.takeAt(self.window_layout.indexOf(self.separator_line_display)).widget().deleteLater()
+                separator_line_width = self.separator_line.width()
+                self.resize(int(self.side_panel_widget.width() + self.separator_line.width() + (self.width() - self.side_panel_widget.width() - self.separator_line.width() - separator_line_width)/2), self.height())
 
-                        with open(filename_save, "w") as file_save:
-                            file_save.write(file_save_data)
-                            file_save.write(data_clustering_algorithm_save)
+            self.display_window1 = False
+            self.remove_undisplayed_cache_data()
 
-                            if num_clusters_save:
-                                file_save.write(num_clusters_save)
+            if not self.display_window2:
+                self.display_data_clustering_window2_button.setEnabled(False)
+
+        elif self.sender().accessibleName() == "Close Display 2":
+            self.window_layout.takeAt(self.window_layout.indexOf(self.display_window2_widget)).widget().deleteLater()
+
+            if self.display_window1:
+                self.window_layout.takeAt(self.window_layout.indexOf(self.separator_line_display)).widget().deleteLater()
+                separator_line_width = self.separator_line.width()
+                self.resize(int(self.side_panel_widget.width() + self.separator_line.width() + (self.width() - self.side_panel_widget.width() - self.separator_line.width() - separator_line_width)/2), self.height())
+
+            self.display_window2 = False
+            self.remove_undisplayed_cache_data()
+
+            if not self.display_window1:
+                self.display_data_clustering_window2_button.setEnabled(False)
+
+    def save_data_clustering(self):
+        """Saves the clustering data as text with a text or CSV file or as an image of the graph."""
+
+        # The display window that the clustering data is saved from is given by the button that was clicked
+        display_window_name = self.sender().accessibleName()
+        dialog = QFileDialog(self)
+        filename_data = dialog.getSaveFileName(self, "Save As", application_directory, "Plain Text (.txt);; Comma Separated Values (.csv);; JPEG (.jpg);; PNG (.png)")
+
+        if filename_data[0]:
+            file_type = ""
+            filename_save = ""
+
+            if filename_data[1]:
+                file_type = filename_data[1].rsplit('.', 1)[1].rsplit(')', 1)[0]
+                filename_save = filename_data[0] + "." + file_type
+
+            # Saves the clustered data as a text or CSV file if either of the two options is selected
+            if file_type == "txt" or file_type == "csv":
+
+                # The clustered data is saved in a background thread so that the interface remains responsive while
+                # large data is saved, with the data copied as assigning numbers to non-numeric values changes it in place
+                self.remove_widget(self.side_panel_layout, self.save_data_error_label)
+
+                # Saves the clustered data from the first display window if the data from the first display window is selected to be saved
+                if display_window_name == "Save Display 1":
+                    QThreadPool.globalInstance().start(SaveClusteredDataTask(self.save_clustered_data_signals, "Display 1", filename_save, self.attribute_data_window1.copy(), self.class_data_window1, self.clustering_data_labels_window1, self.data_clustering_algorithm_window1, self.num_clusters_window1, self.clustering_metric_window1))
+
+                # Saves the clustered data from the second display window if the data from the second display window is selected to be saved
+                elif display_window_name == "Save Display 2":
+                    QThreadPool.globalInstance().start(SaveClusteredDataTask(self.save_clustered_data_signals, "Display 2", filename_save, self.attribute_data_window2.copy(), self.class_data_window2, self.clustering_data_labels_window2, self.data_clustering_algorithm_window2, self.num_clusters_window2, self.clustering_metric_window2))
 
             # Saves an image of the data clustering graph if the option is selected
             elif file_type == "jpg" or file_type == "png":
+                # PNG images are compressed at the fastest compression level as the graphs compress well at any level
+                image_save_options = {'compress_level': 1} if file_type == "png" else None
 
                 # Saves an image of the data clustering graph from the first display window if the option to save the graph from the first display window is selected
-                if self.sender().accessibleName() == "Save Display 1":
-                    for i in range(self.window_layout.count()):
-                        if self.window_layout.itemAt(i):
-                            if self.window_layout.itemAt(i).widget().accessibleName() == "Display 1":
-                                for j in range(self.window_layout.itemAt(i).widget().layout().count()):
-                                    if self.window_layout.itemAt(i).widget().layout().itemAt(j):
-                                        if self.window_layout.itemAt(i).widget().layout().itemAt(j).widget().accessibleName() == "Plot Display 1":
-                                            self.window_layout.itemAt(i).widget().layout().itemAt(j).widget().fig.savefig(filename_save)
-                                            break
-
-                                break
+                if display_window_name == "Save Display 1":
+                    self.plot_widget_window1.fig.savefig(filename_save, pil_kwargs=image_save_options)
 
                 # Saves an image of the data clustering graph from the second display window if the option to save the graph from the second display window is selected
-                elif self.sender().accessibleName() == "Save Display 2":
-                    for i in range(self.window_layout.count()):
-                        if self.window_layout.itemAt(i):
-                            if self.window_layout.itemAt(i).widget().accessibleName() == "Display 2":
-                                for j in range(self.window_layout.itemAt(i).widget().layout().count()):
-                                    if self.window_layout.itemAt(i).widget().layout().itemAt(j):
-                                        if self.window_layout.itemAt(i).widget().layout().itemAt(j).widget().accessibleName() == "Plot Display 2":
-                                            self.window_layout.itemAt(i).widget().layout().itemAt(j).widget().fig.savefig(filename_save)
-                                            break
-
-                                break
+                elif display_window_name == "Save Display 2":
+                    self.plot_widget_window2.fig.savefig(filename_save, pil_kwargs=image_save_options)
+
+    def save_clustered_data_failed(self, display_window_name, filename_save):
+        """Displays an error message if the clustered data from a display window could not be saved."""
+        self.save_data_error_label.setText("The clustered data from " + display_window_name + " could\nnot be saved to the file:\n" + os.path.basename(filename_save))
+        self.remove_widget(self.side_panel_layout, self.save_data_error_label)
+        self.insert_widget(self.side_panel_layout, self.display_data_clustering_window_widget, self.save_data_error_label)
 
     def insert_widget(self, widget_layout, preceding_widget, inserted_widget):
         """Inserts a graphical user interface component after the specified component."""
-        for i in range(widget_layout.count()):
-            if widget_layout.itemAt(i).widget().accessibleName() == preceding_widget.accessibleName():
-                widget_layout.insertWidget(i + 1, inserted_widget)
+        i = widget_layout.indexOf(preceding_widget)
+
+        if i >= 0:
+            widget_layout.insertWidget(i + 1, inserted_widget)
 
     def remove_widget(self, widget_layout, removed_widget):
         """Removes a graphical user interface component and all of its subcomponents."""
-        for i in range(widget_layout.count()):
-            if widget_layout.itemAt(i):
-                if widget_layout.itemAt(i).widget().accessibleName() == removed_widget.accessibleName():
-                    if widget_layout.itemAt(i).widget().layout() and widget_layout.itemAt(i).widget().children():
-                        for j in range(len(widget_layout.itemAt(i).widget().children())):
-                            self.remove_widget_child(widget_layout.itemAt(i).widget().layout())
-
-                        widget = widget_layout.itemAt(i).widget()
-                        widget_layout.removeWidget(widget)
-                        widget.setParent(None)
+        if widget_layout.indexOf(removed_widget) >= 0:
+            if removed_widget.layout():
+                self.remove_widget_child(removed_widget.layout())
 
-                    else:
-                        widget = widget_layout.itemAt(i).widget()
-                        widget_layout.removeWidget(widget)
-                        widget.setParent(None)
+            widget_layout.removeWidget(removed_widget)
+            removed_widget.setParent(None)
 
-                    break
+    def remove_widgets(self, widget_layout, removed_widgets):
+        """Removes the specified graphical user interface components from a layout if they are in the layout."""
+        for widget in removed_widgets:
+            self.remove_widget(widget_layout, widget)
 
     def remove_widget_child(self, widget_layout):
-        """Removes the graphical user interface components of a graphical user interface layout."""
-        if widget_layout.itemAt(0):
-            if widget_layout.itemAt(0).widget().layout() and widget_layout.itemAt(0).widget().children():
-                for i in range(len(widget_layout.itemAt(0).widget().children())):
-                    self.remove_widget_child(widget_layout.itemAt(0).layout())
-
-                widget = widget_layout.itemAt(0).widget()
-                widget_layout.removeWidget(widget)
-                widget.setParent(None)
-
-            else:
-                widget = widget_layout.itemAt(0).widget()
-                widget_layout.removeWidget(widget)
-                widget.setParent(None)
+        """Removes the graphical user interface components of a graphical user interface layout along with
+        the components of their layouts. The components are not deleted as they are added again later."""
+        widget_layouts = [widget_layout]
+
+        while widget_layouts:
+            widget_layout = widget_layouts.pop()
+
+            while widget_layout.count():
+                widget = widget_layout.takeAt(0).widget()
+
+                if widget:
+                    if widget.layout():
+                        widget_layouts.append(widget.layout())
+
+                    widget.setParent(None)
+
+class SaveClusteredDataSignals(QObject):
+    """Signals sent from the background threads that save clustered data to the interface."""
+    save_failed = pyqtSignal(str, str)
+
+class SaveClusteredDataTask(QRunnable):
+    """Saves the clustered data from a display window to a file in a background thread.
+    The graph is not saved in this way as the figure belongs to the interface."""
+    def __init__(self, signals, display_window_name, filename_save, *clustered_data):
+        """Initializes the task with the signals for reporting to the interface, the display window
+        that the clustered data is from, the file to save to and the clustered data."""
+        super(SaveClusteredDataTask, self).__init__()
+        self.signals = signals
+        self.display_window_name = display_window_name
+        self.filename_save = filename_save
+        self.clustered_data = clustered_data
+
+    def run(self):
+        """Saves the clustered data and reports to the interface if the clustered data could not be saved.
+        Any error is caught as an error that escapes the background thread closes the application."""
+        try:
+            save_clustered_data(self.filename_save, *self.clustered_data)
+
+        except Exception:
+            self.signals.save_failed.emit(self.display_window_name, self.filename_save)
 
 class PlotWidget(FigureCanvasQTAgg):
     """Initializes the data clustering graph."""
@@ -1260,6 +1345,7 @@ class PlotWidget(FigureCanvasQTAgg):
         """Initializes the data clustering graph with the specified parameters."""
         self.fig = Figure(figsize=(width, height))
         self.fig.suptitle(title)
+        self.dimension = dimension
 
         if dimension == 2:
             self.ax = self.fig.add_subplot(111)
@@ -1269,6 +1355,11 @@ class PlotWidget(FigureCanvasQTAgg):
 
         super(PlotWidget, self).__init__(self.fig)
 
+    def clear_graph(self, title):
+        """Clears the data clustering graph so that another data clustering can be graphed on it with the specified title."""
+        self.fig.suptitle(title)
+        self.ax.cla()
+
 if __name__ == '__main__':
     application = QApplication(sys.argv)
     interface = DataClusteringVisualizerInterface()